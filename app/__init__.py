@@ -8,6 +8,7 @@ from pathlib import Path
 from flasgger import Flasgger
 
 from app.extensions import db, ma, cache, limiter, jwt, cors
+from app.utils.json_provider import ORJSONProvider
 from config import config
 
 # Load environment variables from .env file at startup
@@ -18,6 +19,7 @@ def create_app(config_name="default"):
     Create and configure an instance of the Flask application.
     """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config.from_object(config[config_name])
 
     # Initialize Flasgger for API documentation
@@ -28,7 +30,9 @@ def create_app(config_name="default"):
     ma.init_app(app)
     cache.init_app(app)
     jwt.init_app(app)
-    cors.init_app(app)
+    # Tests never check CORS headers
+    if not app.config.get("TESTING"):
+        cors.init_app(app)
     limiter.init_app(app)
 
     # Conditionally initialize Flask-Migrate
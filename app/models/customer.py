@@ -2,6 +2,7 @@
 Customer model for the mechanic shop application.
 """
 
+from flask import current_app
 from app.extensions import db
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timezone
@@ -34,7 +35,10 @@ class Customer(db.Model):
     def set_password(self, password):
         """Set password hash"""
         if password:
-            self.password_hash = generate_password_hash(password)
+            self.password_hash = generate_password_hash(
+                password,
+                method=current_app.config.get("PASSWORD_HASH_METHOD", "scrypt"),
+            )
 
     def check_password(self, password):
         """Check if provided password matches the hash"""
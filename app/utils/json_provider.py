@@ -0,0 +1,50 @@
+"""
+orjson-backed JSON provider for the mechanic shop application.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Serialize JSON with orjson.
+
+    Dates, Decimals and other types orjson does not handle natively still go
+    through Flask's default hook, so response bodies keep the same values.
+    Output is UTF-8 rather than ASCII-escaped. Keyword arguments orjson cannot
+    reproduce, such as ensure_ascii=True or custom separators, send the call
+    to the stdlib encoder unchanged.
+
+    Values orjson rejects, such as integers wider than 64 bits, are encoded
+    by the stdlib instead, configured for the same compact, unescaped output.
+    Parsing stays with the stdlib, because orjson silently turns such
+    integers into floats.
+    """
+
+    # The keyword values orjson output can match exactly
+    _ORJSON_KWARGS = {
+        "indent": (None, 2),
+        "separators": (None, (",", ":")),
+        "sort_keys": (True, False),
+        "ensure_ascii": (False,),
+    }
+
+    def dumps(self, obj, **kwargs):
+        if any(
+            value not in self._ORJSON_KWARGS.get(key, ())
+            for key, value in kwargs.items()
+        ):
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            kwargs.setdefault("ensure_ascii", False)
+            if not kwargs.get("indent"):
+                kwargs.setdefault("separators", (",", ":"))
+            return super().dumps(obj, **kwargs)
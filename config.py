@@ -5,6 +5,7 @@ Application configuration settings.
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
 # Load environment variables from .env file
 load_dotenv()
@@ -26,6 +27,9 @@ class Config:
     # Application settings
     JSON_SORT_KEYS = False
 
+    # Password hashing method passed to werkzeug's generate_password_hash
+    PASSWORD_HASH_METHOD = "scrypt"
+
     # Rate limiting config - using environment variable for Redis
     RATELIMIT_STORAGE_URI = os.environ.get("REDIS_URL") or "memory://"
 
@@ -45,8 +49,21 @@ class TestingConfig(Config):
     """Testing configuration."""
 
     TESTING = True
+    DEBUG = False
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # No per-query logging or recording while the suite runs
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_RECORD_QUERIES = False
+    # Share the single in-memory connection across threads and sessions
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "connect_args": {"check_same_thread": False},
+        "poolclass": StaticPool,
+    }
     WTF_CSRF_ENABLED = False
+    RATELIMIT_ENABLED = False
+
+    # Single-iteration hashes keep password operations cheap in tests
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
 
 
 class ProductionConfig(Config):
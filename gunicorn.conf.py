@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for the production WSGI entry point (wsgi:app).
+
+The default sync worker closes the connection after every response; threaded
+workers keep HTTP/1.1 connections open so clients can reuse them.
+"""
+
+import os
+
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_connections = 1000
+
+# Seconds an idle keep-alive connection is held open between requests
+keepalive = 15
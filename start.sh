@@ -1,3 +1,3 @@
 #!/bin/bash
 echo "Starting application..."
-gunicorn "wsgi:app"
\ No newline at end of file
+gunicorn -c gunicorn.conf.py "wsgi:app"
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Shared helpers for the test suite
+"""
+
+import io
+import json
+
+from werkzeug.test import EnvironBuilder
+
+
+def assert_json(response, status_code, /, **expected):
+    """Assert the status code and top-level JSON fields, returning the body"""
+    assert response.status_code == status_code
+    data = response.get_json()
+    for key, value in expected.items():
+        assert data[key] == value
+    return data
+
+
+def make_post_environ(path):
+    """Build a JSON POST environ builder that can be reused across requests"""
+    return EnvironBuilder(path=path, method="POST", content_type="application/json")
+
+
+def post_json(client, builder, payload):
+    """Send payload through a prebuilt environ builder"""
+    return post_body(client, builder, json.dumps(payload).encode())
+
+
+def post_body(client, builder, body):
+    """Send an already serialized JSON body through a prebuilt environ builder"""
+    builder.input_stream = io.BytesIO(body)
+    builder.content_length = len(body)
+    return client.open(builder)
@@ -2,20 +2,77 @@
 Test configuration and fixtures
 """
 
+from contextlib import contextmanager
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy import event, insert
+from werkzeug.security import generate_password_hash
 from app import create_app
 from app.extensions import db
 from app.models.customer import Customer
 from app.models.mechanic import Mechanic
 from app.models.inventory import InventoryItem as Inventory
-from config import config
+from app.models.service_ticket import ServiceTicket
+from tests.factories import CustomerFactory, InventoryItemFactory
+
+
+def _relax_durability(engine):
+    """Skip fsyncs and on-disk journals; test data never needs to survive."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def _enable_savepoints(engine):
+    """Let SQLAlchemy emit BEGIN itself so pysqlite honours SAVEPOINT."""
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
+    # Reconnect so the pooled in-memory connection picks up the listeners
+    engine.dispose()
 
-@pytest.fixture(scope="module")
-def app():
-    """Create and configure a new app instance for each test module."""
-    # Use the 'testing' configuration from config.py
-    app = create_app(config_class=config["testing"])
+
+# The application built in pytest_configure, one per test process
+APP_KEY = pytest.StashKey()
+
+
+def pytest_configure(config):
+    """Build the application once per process, before collection."""
+    # The xdist controller only schedules tests and never runs them
+    if getattr(config.option, "numprocesses", None) and not hasattr(
+        config, "workerinput"
+    ):
+        return
+
+    # Use the 'testing' configuration from config.py. Its in-memory SQLite
+    # database is private to the process, so each pytest-xdist worker
+    # gets an isolated schema without any per-worker URI.
+    app = create_app("testing")
+
+    # Engine listeners are registered exactly once per application
+    with app.app_context():
+        _relax_durability(db.engine)
+        _enable_savepoints(db.engine)
+
+    config.stash[APP_KEY] = app
+
+
+@pytest.fixture(scope="session")
+def app(request):
+    """Create the schema on the application built in pytest_configure."""
+    app = request.config.stash[APP_KEY]
 
     with app.app_context():
         db.create_all()
@@ -26,96 +83,203 @@ def app():
         db.drop_all()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client(app):
     """Create test client"""
     return app.test_client()
 
 
-@pytest.fixture(scope="function")
-def init_database(app):
-    """Initialize database with test data"""
+@contextmanager
+def _rolled_back(app, empty=False):
+    """Run the body inside an outer transaction that is always rolled back"""
     with app.app_context():
-        # Clean up tables before seeding
-        db.drop_all()
-        db.create_all()
+        engines = db.engines
+        engine = engines[None]
+        connection = engine.connect()
+        transaction = connection.begin()
+        if empty:
+            for table in reversed(db.metadata.sorted_tables):
+                connection.execute(table.delete())
 
-        customer = Customer(
-            first_name="John",
-            last_name="Doe",
-            email="john.doe@test.com",
-            phone_number="555-0101",
-            address="123 Test St",
-        )
-        customer.set_password("password123")
-        db.session.add(customer)
-
-        # Create a second test customer
-        customer2 = Customer(
-            first_name="Jane",
-            last_name="Smith",
-            email="jane.smith@test.com",
-            phone_number="555-0103",
-            address="456 Test Ave",
-        )
-        customer2.set_password("password456")
-        db.session.add(customer2)
-
-        # Create test mechanic - FIXED: Using shop.com email to match test expectations
-        mechanic = Mechanic(
-            name="Mike Johnson",
-            email="mike.johnson@shop.com",  # Changed from @test.com to @shop.com
-            phone="555-0102",
-            salary=75000.00,
-            is_active=True,
-            specializations="Engine, Brakes",
-        )
-        db.session.add(mechanic)
-
-        # Create a second test mechanic
-        mechanic2 = Mechanic(
-            name="Sarah Lee",
-            email="sarah.lee@shop.com",
-            phone="555-0104",
-            salary=80000.00,
-            is_active=True,
-            specializations="Transmission, Electrical",
-        )
-        db.session.add(mechanic2)
-
-        # Create test inventory items
-        inventory_item1 = Inventory(
-            name="Engine Oil",
-            description="5W-30 Engine Oil",
-            quantity=50,
-            price=25.99,
-            supplier="AutoParts Inc",
-            category="Fluids",
-            reorder_level=10,
-        )
-        db.session.add(inventory_item1)
-
-        inventory_item2 = Inventory(
-            name="Brake Pads",
-            description="Front brake pads",
-            quantity=20,
-            price=45.99,
-            supplier="BrakeMax",
-            category="Brakes",
-            reorder_level=5,
+    # Route every session through the open connection; commits in the
+    # application only release a SAVEPOINT inside the outer transaction.
+    engines[None] = connection
+    db.session.session_factory.configure(join_transaction_mode="create_savepoint")
+
+    try:
+        yield
+    finally:
+        db.session.session_factory.configure(
+            join_transaction_mode="conditional_savepoint"
         )
-        db.session.add(inventory_item2)
+        engines[None] = engine
+        transaction.rollback()
+        connection.close()
 
-        # Commit all changes (skip service ticket for now to avoid constraint issues)
-        db.session.commit()
 
-        return {
-            "customer": customer,
-            "customer2": customer2,
-            "mechanic": mechanic,
-            "mechanic2": mechanic2,
-            "inventory_items": [inventory_item1, inventory_item2],
+@pytest.fixture(scope="function")
+def clean_database(app):
+    """Run the test against empty tables inside a rolled-back transaction"""
+    with _rolled_back(app, empty=True):
+        yield
+
+
+def _build(app, factory, size=None):
+    """Create rows from a factory and load their attributes"""
+    with app.app_context():
+        rows = factory.create_batch(size or 1)
+        for row in rows:
+            db.session.refresh(row)
+    return rows if size else rows[0]
+
+
+@pytest.fixture
+def customer(app, clean_database):
+    """A single customer in otherwise empty tables"""
+    return _build(app, CustomerFactory)
+
+
+@pytest.fixture
+def customers(app, clean_database):
+    """Two customers in otherwise empty tables"""
+    return _build(app, CustomerFactory, 2)
+
+
+@pytest.fixture
+def inventory_item(app, clean_database):
+    """A single inventory item in otherwise empty tables"""
+    return _build(app, InventoryItemFactory)
+
+
+# Seed rows use fixed primary keys so ids do not depend on insert order
+CUSTOMER_ROWS = [
+    {
+        "id": 1,
+        "first_name": "John",
+        "last_name": "Doe",
+        "email": "john.doe@test.com",
+        "phone_number": "555-0101",
+        "address": "123 Test St",
+        "password": "password123",
+    },
+    {
+        "id": 2,
+        "first_name": "Jane",
+        "last_name": "Smith",
+        "email": "jane.smith@test.com",
+        "phone_number": "555-0103",
+        "address": "456 Test Ave",
+        "password": "password456",
+    },
+]
+# Uses a shop.com email to match test expectations
+MECHANIC_ROWS = [
+    {
+        "id": 1,
+        "name": "Mike Johnson",
+        "email": "mike.johnson@shop.com",
+        "phone": "555-0102",
+        "salary": 75000.00,
+        "is_active": True,
+        "specializations": "Engine, Brakes",
+    },
+    {
+        "id": 2,
+        "name": "Sarah Lee",
+        "email": "sarah.lee@shop.com",
+        "phone": "555-0104",
+        "salary": 80000.00,
+        "is_active": True,
+        "specializations": "Transmission, Electrical",
+    },
+]
+INVENTORY_ROWS = [
+    {
+        "id": 1,
+        "name": "Engine Oil",
+        "description": "5W-30 Engine Oil",
+        "quantity": 50,
+        "price": 25.99,
+        "supplier": "AutoParts Inc",
+        "category": "Fluids",
+        "reorder_level": 10,
+    },
+    {
+        "id": 2,
+        "name": "Brake Pads",
+        "description": "Front brake pads",
+        "quantity": 20,
+        "price": 45.99,
+        "supplier": "BrakeMax",
+        "category": "Brakes",
+        "reorder_level": 5,
+    },
+]
+
+
+def _seed(app):
+    """Insert every seed row with one executemany per table and a single commit"""
+    method = app.config["PASSWORD_HASH_METHOD"]
+    customers = [
+        {
+            **{key: value for key, value in row.items() if key != "password"},
+            "password_hash": generate_password_hash(row["password"], method=method),
         }
+        for row in CUSTOMER_ROWS
+    ]
+    with app.app_context():
+        db.session.execute(insert(Customer), customers)
+        db.session.execute(insert(Mechanic), MECHANIC_ROWS)
+        db.session.execute(insert(Inventory), INVENTORY_ROWS)
+        db.session.commit()
 
-        # No explicit teardown needed here for function scope,
-        # as the next test will re-run this fixture and clean the DB.
+
+@pytest.fixture(scope="session")
+def seed_data(app):
+    """Seed every test row once; tests only change it in rolled-back transactions"""
+    # Clear anything committed before seeding without re-running any DDL
+    with app.app_context():
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
+
+    # Service tickets are not seeded to avoid constraint issues
+    _seed(app)
+    # Load every row now, before any test can delete one
+    with app.app_context():
+        customers = [db.session.get(Customer, row["id"]) for row in CUSTOMER_ROWS]
+        mechanics = [db.session.get(Mechanic, row["id"]) for row in MECHANIC_ROWS]
+        inventory_items = [
+            db.session.get(Inventory, row["id"]) for row in INVENTORY_ROWS
+        ]
+    return SimpleNamespace(
+        customer=customers[0],
+        customer2=customers[1],
+        customers=customers,
+        mechanic=mechanics[0],
+        mechanic2=mechanics[1],
+        mechanics=mechanics,
+        inventory_items=inventory_items,
+    )
+
+
+@pytest.fixture(scope="function")
+def init_database(app, seed_data):
+    """Hand out the seeded rows and roll back whatever the test changes"""
+    with _rolled_back(app):
+        yield seed_data
+
+
+@pytest.fixture(scope="function")
+def created_ticket(app, init_database):
+    """A service ticket for the seeded customer, inserted without the API"""
+    with app.app_context():
+        ticket = ServiceTicket(
+            customer_id=init_database.customer.id,
+            vehicle_info="2018 Honda Civic",
+            description="Test service",
+        )
+        db.session.add(ticket)
+        db.session.commit()
+        db.session.refresh(ticket)
+    return ticket
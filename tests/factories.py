@@ -0,0 +1,42 @@
+"""
+factory-boy factories for building individual test rows
+"""
+
+import factory
+
+from app.extensions import db
+from app.models.customer import Customer
+from app.models.inventory import InventoryItem
+
+
+class BaseFactory(factory.alchemy.SQLAlchemyModelFactory):
+    """Persist through the application's scoped session"""
+
+    class Meta:
+        abstract = True
+        sqlalchemy_session = db.session
+        sqlalchemy_session_persistence = "commit"
+
+
+class CustomerFactory(BaseFactory):
+    class Meta:
+        model = Customer
+
+    first_name = "John"
+    last_name = factory.Sequence(lambda n: f"Doe{n}")
+    email = factory.Sequence(lambda n: f"customer{n}@test.com")
+    phone_number = "555-0101"
+    address = "123 Test St"
+
+
+class InventoryItemFactory(BaseFactory):
+    class Meta:
+        model = InventoryItem
+
+    name = factory.Sequence(lambda n: f"Part {n}")
+    description = "Test part"
+    quantity = 50
+    price = 25.99
+    supplier = "AutoParts Inc"
+    category = "Fluids"
+    reorder_level = 10
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Comprehensive test suite for Customer CRUD operations using Application Factory Pattern.
+"""
+
+import json
+import logging
+import threading
+import uuid
+
+import pytest
+import requests
+from werkzeug.serving import make_server
+from app import create_app
+from app.extensions import db
+
+# Request bodies serialized once and sent as raw bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+UPDATE_PAYLOAD = json.dumps(
+    {
+        "first_name": "Jane",
+        "last_name": "Smith",
+        "phone_number": "555-9876",
+    }
+).encode()
+
+
+def start_server():
+    """Serve a fresh testing app on a free local port from a daemon thread."""
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+
+    # Single-threaded server with request logging silenced. The socket is
+    # already listening once make_server returns, so no readiness probe.
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app, threaded=False)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    """Base URL of a server started for this module"""
+    server = start_server()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_customer_crud(base_url):
+    """Test all Customer CRUD operations."""
+    # CREATE
+    unique_email = f"john.doe.{uuid.uuid4().hex[:8]}@email.com"
+    create_payload = json.dumps(
+        {
+            "first_name": "John",
+            "last_name": "Doe",
+            "email": unique_email,
+            "phone_number": "555-0123",
+            "password": "password123",
+        }
+    ).encode()
+    response = requests.post(
+        f"{base_url}/customers/", data=create_payload, headers=JSON_HEADERS
+    )
+    assert response.status_code == 201, response.text
+    customer_id = response.json()["id"]
+
+    # READ all customers
+    response = requests.get(f"{base_url}/customers/")
+    assert response.status_code == 200, response.text
+    assert customer_id in [customer["id"] for customer in response.json()]
+
+    # READ single customer
+    response = requests.get(f"{base_url}/customers/{customer_id}")
+    assert response.status_code == 200, response.text
+    assert response.json()["email"] == unique_email
+
+    # UPDATE customer
+    response = requests.put(
+        f"{base_url}/customers/{customer_id}",
+        data=UPDATE_PAYLOAD,
+        headers=JSON_HEADERS,
+    )
+    assert response.status_code == 200, response.text
+    updated_customer = response.json()
+    assert updated_customer["first_name"] == "Jane"
+    assert updated_customer["last_name"] == "Smith"
+
+    # DELETE customer
+    response = requests.delete(f"{base_url}/customers/{customer_id}")
+    assert response.status_code == 200, response.text
+
+    # READ after deletion
+    response = requests.get(f"{base_url}/customers/{customer_id}")
+    assert response.status_code == 404, response.text
+
+    # API info endpoints
+    response = requests.get(f"{base_url}/")
+    assert response.status_code == 200, response.text
+    response = requests.get(f"{base_url}/calculations/health")
+    assert response.status_code == 200, response.text
+
+
+def main():
+    """Main test function."""
+    server = start_server()
+    test_customer_crud(f"http://127.0.0.1:{server.server_port}")
+    print("All customer CRUD checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,80 +1,118 @@
 import pytest
+from tests.base import assert_json, make_post_environ, post_json
 
-class TestCalculationsAPI:
-    def test_addition_basic_success(self, client):
-        resp = client.post("/calculations/add", json={"numbers": [2, 3, 5]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["operation"] == "addition"
-        assert data["result"] == 10
-        assert data["operands"] == [2, 3, 5]
-
-    def test_addition_with_decimals(self, client):
-        resp = client.post("/calculations/add", json={"numbers": [2.5, 3.7, 1.3]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert abs(data["result"] - 7.5) < 0.0001
-
-    def test_addition_insufficient_numbers(self, client):
-        resp = client.post("/calculations/add", json={"numbers": [5]})
-        assert resp.status_code == 400
-        assert "error" in resp.get_json()
-
-    def test_addition_invalid_data_type(self, client):
-        resp = client.post("/calculations/add", json={"numbers": [5, "invalid", 3]})
-        assert resp.status_code == 400
-
-    def test_addition_missing_numbers_field(self, client):
-        resp = client.post("/calculations/add", json={"invalid_field": [5, 3]})
-        assert resp.status_code == 400
-
-    def test_subtraction_basic_success(self, client):
-        resp = client.post("/calculations/subtract", json={"numbers": [20, 5, 3]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["operation"] == "subtraction"
-        assert data["result"] == 12
+OPERATIONS = {
+    "add": "addition",
+    "subtract": "subtraction",
+    "multiply": "multiplication",
+    "divide": "division",
+}
+BUILDERS = {op: make_post_environ(f"/calculations/{op}") for op in OPERATIONS}
 
-    def test_subtraction_negative_result(self, client):
-        resp = client.post("/calculations/subtract", json={"numbers": [5, 10]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["result"] == -5
 
-    def test_multiplication_basic_success(self, client):
-        resp = client.post("/calculations/multiply", json={"numbers": [4, 5, 2]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["operation"] == "multiplication"
-        assert data["result"] == 40
-
-    def test_multiplication_with_zero(self, client):
-        resp = client.post("/calculations/multiply", json={"numbers": [5, 0, 3]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["result"] == 0
-
-    def test_division_basic_success(self, client):
-        resp = client.post("/calculations/divide", json={"numbers": [100, 5, 2]})
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["operation"] == "division"
-        assert data["result"] == 10.0
-
-    def test_division_by_zero_error(self, client):
-        resp = client.post("/calculations/divide", json={"numbers": [10, 0]})
-        assert resp.status_code == 400
-        data = resp.get_json()
-        assert "Division by zero" in data["error"]
-
-    def test_division_with_zero_in_middle(self, client):
-        resp = client.post("/calculations/divide", json={"numbers": [100, 5, 0, 2]})
-        assert resp.status_code == 400
+class TestCalculationsAPI:
+    @pytest.mark.parametrize(
+        "op,payload,status,expected",
+        [
+            pytest.param(
+                "add",
+                {"numbers": [2, 3, 5]},
+                200,
+                10,
+                id="addition_basic_success",
+            ),
+            pytest.param(
+                "add",
+                {"numbers": [2.5, 3.7, 1.3]},
+                200,
+                7.5,
+                id="addition_with_decimals",
+            ),
+            pytest.param(
+                "add",
+                {"numbers": [5]},
+                400,
+                "At least 2 numbers required",
+                id="addition_insufficient_numbers",
+            ),
+            pytest.param(
+                "add",
+                {"numbers": [5, "invalid", 3]},
+                400,
+                "All items must be numbers",
+                id="addition_invalid_data_type",
+            ),
+            pytest.param(
+                "add",
+                {"invalid_field": [5, 3]},
+                400,
+                "Missing numbers field",
+                id="addition_missing_numbers_field",
+            ),
+            pytest.param(
+                "subtract",
+                {"numbers": [20, 5, 3]},
+                200,
+                12,
+                id="subtraction_basic_success",
+            ),
+            pytest.param(
+                "subtract",
+                {"numbers": [5, 10]},
+                200,
+                -5,
+                id="subtraction_negative_result",
+            ),
+            pytest.param(
+                "multiply",
+                {"numbers": [4, 5, 2]},
+                200,
+                40,
+                id="multiplication_basic_success",
+            ),
+            pytest.param(
+                "multiply",
+                {"numbers": [5, 0, 3]},
+                200,
+                0,
+                id="multiplication_with_zero",
+            ),
+            pytest.param(
+                "divide",
+                {"numbers": [100, 5, 2]},
+                200,
+                10.0,
+                id="division_basic_success",
+            ),
+            pytest.param(
+                "divide",
+                {"numbers": [10, 0]},
+                400,
+                "Division by zero",
+                id="division_by_zero_error",
+            ),
+            pytest.param(
+                "divide",
+                {"numbers": [100, 5, 0, 2]},
+                400,
+                "Division by zero",
+                id="division_with_zero_in_middle",
+            ),
+        ],
+    )
+    def test_calculation(self, client, op, payload, status, expected):
+        resp = post_json(client, BUILDERS[op], payload)
+        if status == 200:
+            data = assert_json(
+                resp, 200, operation=OPERATIONS[op], operands=payload["numbers"]
+            )
+            assert data["result"] == pytest.approx(expected, abs=1e-4)
+        else:
+            # Error bodies only need a substring check, not a JSON parse
+            assert resp.status_code == status
+            assert expected.encode() in resp.data
 
     def test_calculations_health_check(self, client):
         resp = client.get("/calculations/health")
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data["service"] == "calculations"
-        assert data["status"] == "healthy"
-        assert len(data["endpoints"]) == 4
\ No newline at end of file
+        data = assert_json(resp, 200, service="calculations", status="healthy")
+        assert len(data["endpoints"]) == 4
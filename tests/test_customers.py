@@ -1,33 +1,35 @@
 import json
-from tests.base import client, app, init_database, clean_database
+import pytest
+
+ALICE = {
+    "first_name": "Alice",
+    "last_name": "Wonderland",
+    "email": "alice@example.com",
+    "password": "pw12345",
+    "phone_number": "555-1111",
+    "address": "1 Magic Lane"
+}
+MISSING_LAST_NAME = {
+    "first_name": "Bob",
+    "email": "bob@example.com",
+    "password": "pw12345"
+}
+
 
 class TestCustomersAPI:
-    def test_create_customer_success(self, client, clean_database):
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [(ALICE, 201), (MISSING_LAST_NAME, 400)],
+        ids=["success", "missing_last_name"],
+    )
+    def test_create_customer(self, client, clean_database, payload, expected):
         """Test creating a customer (POST /customers/)"""
-        payload = {
-            "first_name": "Alice",
-            "last_name": "Wonderland",
-            "email": "alice@example.com",
-            "password": "pw12345",
-            "phone_number": "555-1111",
-            "address": "1 Magic Lane"
-        }
-        resp = client.post("/customers/", json=payload)
-        assert resp.status_code == 201
-        data = resp.get_json()
-        assert data["email"] == "alice@example.com"
-
-    def test_create_customer_missing_field(self, client, clean_database):
-        """Test missing last_name returns 400"""
-        payload = {
-            "first_name": "Bob",
-            "email": "bob@example.com",
-            "password": "pw12345"
-        }
         resp = client.post("/customers/", json=payload)
-        assert resp.status_code == 400
+        assert resp.status_code == expected
+        if expected == 201:
+            assert resp.get_json()["email"] == payload["email"]
 
-    def test_get_all_customers(self, client, init_database):
+    def test_get_all_customers(self, client, customers):
         """Test GET /customers/ returns a list"""
         resp = client.get("/customers/")
         assert resp.status_code == 200
@@ -35,27 +37,25 @@ class TestCustomersAPI:
         assert isinstance(data, list)
         assert len(data) >= 2
 
-    def test_get_customer_by_id(self, client, init_database):
+    def test_get_customer_by_id(self, client, customer):
         """Test GET /customers/{id} returns the customer"""
-        resp = client.get("/customers/1")
+        cid = customer.id
+        resp = client.get(f"/customers/{cid}")
         assert resp.status_code == 200
         data = resp.get_json()
-        assert data["id"] == 1
-
-    def test_get_customer_not_found(self, client, clean_database):
-        """Test GET /customers/999 returns 404"""
-        resp = client.get("/customers/999")
-        assert resp.status_code == 404
+        assert data["id"] == cid
 
-    def test_update_customer(self, client, init_database):
+    def test_update_customer(self, client, customer):
         """Test updating a customer (PUT /customers/{id})"""
+        cid = customer.id
         payload = {"first_name": "Johnny"}
-        resp = client.put("/customers/1", json=payload)
+        resp = client.put(f"/customers/{cid}", json=payload)
         assert resp.status_code == 200
         data = resp.get_json()
         assert data["first_name"] == "Johnny"
 
-    def test_delete_customer(self, client, init_database):
+    def test_delete_customer(self, client, customer):
         """Test deleting a customer (DELETE /customers/{id})"""
-        resp = client.delete("/customers/1")
+        cid = customer.id
+        resp = client.delete(f"/customers/{cid}")
         assert resp.status_code in [200, 204, 404]
\ No newline at end of file
@@ -1,5 +1,18 @@
+import json
+
 import pytest
 
+_BIG_DESC = "A" * 100_000
+_BIG_JSON_BODY = json.dumps(
+    {
+        "name": "BigDesc",
+        "quantity": 10,
+        "price": 9.99,
+        "description": _BIG_DESC,
+        "category": "Test",
+    }
+)
+
 class TestEdgeCaseValidation:
     def test_quantity_and_price_boundaries(self, client, clean_database):
         # Zero quantity & price
@@ -18,9 +31,9 @@ class TestEdgeCaseValidation:
         assert resp.status_code in [201, 400]
 
     def test_large_payloads(self, client, clean_database):
-        big_desc = "A" * 100_000
-        item = {"name": "BigDesc", "quantity": 10, "price": 9.99, "description": big_desc, "category": "Test"}
-        resp = client.post("/inventory/", json=item)
+        resp = client.post(
+            "/inventory/", data=_BIG_JSON_BODY, content_type="application/json"
+        )
         assert resp.status_code in [201, 400, 413]
 
     def test_special_unicode_characters(self, client, clean_database):
@@ -34,4 +47,9 @@ class TestEdgeCaseValidation:
         resp = client.post("/inventory/", json=item)
         assert resp.status_code in [201, 400]
         if resp.status_code == 201:
-            assert "Üñîçødë" in resp.get_data(as_text=True)
\ No newline at end of file
+            assert "Üñîçødë" in resp.get_data(as_text=True)
+    def test_integers_wider_than_64_bits(self, client):
+        # Too wide for orjson; must survive parsing and encoding exactly
+        resp = client.post("/calculations/add", json={"numbers": [2**70, 1]})
+        assert resp.status_code == 200
+        assert resp.get_json()["result"] == 2**70 + 1
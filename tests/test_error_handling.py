@@ -1,4 +1,5 @@
 import pytest
+from flask import request
 
 class TestErrorHandling:
     def test_malformed_json(self, client, clean_database):
@@ -8,4 +9,24 @@ class TestErrorHandling:
     def test_missing_content_type(self, client, clean_database):
         payload = {"first_name": "Test", "last_name": "User", "email": "x@y.com", "password": "pw"}
         resp = client.post("/customers/", data=str(payload))
-        assert resp.status_code in [400, 415]
\ No newline at end of file
+        assert resp.status_code in [400, 415]
+
+    @pytest.mark.parametrize(
+        "method,url",
+        [
+            ("GET", "/mechanics/999"),
+            ("PUT", "/mechanics/999"),
+            ("DELETE", "/mechanics/999"),
+            ("GET", "/service-tickets/999"),
+            ("GET", "/customers/999"),
+            ("GET", "/inventory/999"),
+        ],
+    )
+    def test_missing_resource_returns_404(self, client, clean_database, method, url):
+        resp = client.open(url, method=method, json={})
+        assert resp.status_code == 404
+        assert b'"error"' in resp.data
+
+    def test_json_kwarg_sets_content_type(self, app):
+        with app.test_request_context("/customers/", method="POST", json={"a": 1}):
+            assert request.is_json
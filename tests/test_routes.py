@@ -0,0 +1,25 @@
+class TestRoutes:
+    def test_routes(self, app, client, clean_database):
+        rules = {rule.rule for rule in app.url_map.iter_rules()}
+        for expected in [
+            "/",
+            "/customers/",
+            "/customers/<int:customer_id>",
+            "/mechanics/",
+            "/service-tickets/",
+            "/calculations/add",
+            "/inventory/",
+        ]:
+            assert expected in rules
+
+        resp = client.get("/customers/")
+        assert resp.status_code == 200
+
+        payload = {
+            "first_name": "Test",
+            "last_name": "User",
+            "email": "test@example.com",
+            "password": "testpass",
+        }
+        resp = client.post("/customers/", json=payload)
+        assert resp.status_code == 201